@@ -1,42 +1,247 @@
+import functools
 import hashlib
-from typing import List, Tuple, Literal
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+from operator import ne, xor
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 # --- Helpers ---
-def hash_data(data: str) -> str:
-    """Generate SHA-256 hash for the given string."""
-    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+# Every node is a raw digest of this many bytes
+_DIGEST_SIZE = 32
 
-def build_merkle_tree(leaf_hashes: List[str]) -> List[List[str]]:
-    """Builds a Merkle Tree ensuring unpaired nodes are properly hashed."""
-    if not leaf_hashes:
-        return [] # Handle empty input
+# The hash constructor used for clauses and tree nodes, resolved once. It defaults to the
+# OpenSSL-backed SHA-256, which builds a one-shot digest per call; copying a pre-initialized
+# context is measurably no faster from Python.
+_hash_new = hashlib.sha256
 
-    tree = [leaf_hashes]
-    while len(tree[-1]) > 1:
-        level = tree[-1]
-        next_level = []
+def set_hash_function(hash_new: Callable[[bytes], Any]) -> None:
+    """
+    Switches the hash used for clauses and tree nodes, e.g. to hashlib.blake2s or blake3.blake3
+    when SHA-256 compatibility is not required. Roots built with different hashes never match.
+    The constructor must produce 32-byte digests. Clears all memoized trees, proofs and results.
+    """
+    global _hash_new
+    if len(hash_new(b'').digest()) != _DIGEST_SIZE:
+        raise ValueError(f"Hash function must produce {_DIGEST_SIZE}-byte digests.")
+    _hash_new = hash_new
+    _build_cached.cache_clear()
+    _proof_state.cache_clear()
+    _hash_intern.clear()
+    _verify_cached.cache_clear()
+
+# Clause digests handed out recently, so equal digests are usually the same object.
+# Capped: once full the table is cleared and refills, which only costs the identity fast path.
+_hash_intern: Dict[bytes, bytes] = {}
+_HASH_INTERN_MAX = 1 << 16
+
+def _intern(digest: bytes) -> bytes:
+    """Returns the canonical object for the digest (hash-consing, within the table's cap)."""
+    canonical = _hash_intern.get(digest)
+    if canonical is None:
+        if len(_hash_intern) >= _HASH_INTERN_MAX:
+            _hash_intern.clear()
+        canonical = _hash_intern[digest] = digest
+    return canonical
+
+def hash_data(data: str) -> bytes:
+    """
+    Generate the raw 32-byte digest (SHA-256 by default) for the given string.
+    The digest is interned in a table capped at _HASH_INTERN_MAX entries.
+    """
+    return _intern(_hash_new(data.encode('utf-8')).digest())
 
-        # Process in pairs, properly hashing unpaired nodes
-        for i in range(0, len(level), 2):
-            left_child = level[i]
-            # Handle odd number of nodes by duplicating the last one
-            right_child = level[i + 1] if i + 1 < len(level) else level[i]
+# hashlib only releases the GIL while hashing inputs of at least 2 KiB, and a thread pool
+# only pays for its startup once there is a fair amount of such input to split up.
+_GIL_RELEASE_MIN_BYTES = 2048
+_PARALLEL_MIN_TOTAL_BYTES = 1 << 20
 
-            # Hash the pair (left + right)
-            combined = hash_data(left_child + right_child)
-            next_level.append(combined)
+def _hash_chunk(chunk: List[bytes]) -> List[bytes]:
+    """Hashes a run of encoded clauses."""
+    hash_new = _hash_new # Local name lookups are the cheapest inside the comprehension
+    return [hash_new(data).digest() for data in chunk]
 
-        tree.append(next_level)
+def hash_clauses(clauses: List[str]) -> List[bytes]:
+    """
+    Hashes a batch of clauses into leaf digests, encoding each clause once.
+    Digests are interned like hash_data's, in the same capped table.
+    Large batches of long clauses are hashed on a thread pool, one chunk per CPU.
+    """
+    encoded = list(map(str.encode, clauses))
+    workers = os.cpu_count() or 1
+    total_bytes = sum(map(len, encoded))
+    if (workers > 1 and total_bytes >= _PARALLEL_MIN_TOTAL_BYTES
+            and total_bytes >= _GIL_RELEASE_MIN_BYTES * len(encoded)):
+        step = -(-len(encoded) // workers) # Ceiling division so every clause lands in a chunk
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_hash_chunk, [encoded[i:i + step] for i in range(0, len(encoded), step)])
+            digests = [digest for chunk in chunks for digest in chunk]
+    else:
+        digests = _hash_chunk(encoded)
+
+    return list(map(_intern, digests))
+
+# A Merkle tree is a list of levels (leaves first, root last). All levels are read-only
+# views into one flat bytes buffer, so node i of a level lives at [i * 32, (i + 1) * 32).
+# In the buffer, every level with an odd node count (other than the root) is followed
+# by a copy of its last node, so hashing a level only ever sees full pairs.
+MerkleTree = List[memoryview]
+
+def _pad_to_pairs(nodes: List[bytes]) -> List[bytes]:
+    """Duplicates the last node of an odd, non-root level so it pairs with itself."""
+    if len(nodes) > 1 and len(nodes) % 2:
+        nodes.append(nodes[-1])
+    return nodes
+
+def _tree_layout(leaf_count: int) -> List[Tuple[int, int]]:
+    """Returns (byte offset, node count) of every level in the flat buffer, leaves first."""
+    layout = []
+    offset, count = 0, leaf_count
+    while True:
+        layout.append((offset, count))
+        if count == 1:
+            return layout
+        offset += (count + count % 2) * _DIGEST_SIZE # Odd levels carry a padding copy of their last node
+        count = (count + 1) // 2
+
+def build_merkle_tree(leaf_hashes: List[bytes]) -> MerkleTree:
+    """
+    Builds a Merkle Tree ensuring unpaired nodes are properly hashed.
+    Nodes are raw 32-byte digests; hex encoding only happens at the display boundary.
+    Trees are memoized by their leaves; each call gets its own list of read-only level views.
+    """
+    if not leaf_hashes:
+        return [] # Handle empty input
+
+    return list(_build_cached(tuple(leaf_hashes)))
+
+# Bounded so that memoized trees do not keep every contract ever hashed alive.
+# Identical contracts share one tree.
+@functools.lru_cache(maxsize=256)
+def _build_cached(leaf_hashes: Tuple[bytes, ...]) -> MerkleTree:
+    """Builds the tree for a non-empty tuple of leaf hashes."""
+    leaf_count = len(leaf_hashes)
+    # Power-of-two trees never have an odd level, so they take a specialized path with no padding
+    build = _build_pow2 if leaf_count & (leaf_count - 1) == 0 else _build_generic
+    return build(leaf_hashes)
+
+def _join_leaves(leaves: Sequence[bytes]) -> bytes:
+    """Concatenates the leaf digests, rejecting any that are not digest-sized."""
+    # Check every leaf, not the total length: 31- and 33-byte leaves would add up to two digests.
+    # map(len) keeps the check in C.
+    if not set(map(len, leaves)) <= {_DIGEST_SIZE}:
+        raise ValueError(f"Leaf hashes must all be {_DIGEST_SIZE}-byte digests.")
+    return b''.join(leaves)
+
+def _build_generic(leaf_hashes: Tuple[bytes, ...]) -> MerkleTree:
+    """Builds a tree of any size, padding odd levels with a copy of their last node."""
+    nodes = _join_leaves(_pad_to_pairs(list(leaf_hashes)))
+
+    # Hash each (already padded) level from the one below, then pack them all into one
+    # immutable buffer (the root comes last) sliced into per-level views
+    layout = _tree_layout(len(leaf_hashes))
+    levels = [nodes]
+    for _ in layout[1:]:
+        nodes = b''.join(_pad_to_pairs(_hash_pairs(nodes)))
+        levels.append(nodes)
+    buf = memoryview(b''.join(levels))
+    return [buf[offset:offset + count * _DIGEST_SIZE] for offset, count in layout]
+
+def _build_pow2(leaf_hashes: Tuple[bytes, ...]) -> MerkleTree:
+    """Builds a tree whose leaf count is a power of two: every level halves, with no padding."""
+    nodes = _join_leaves(leaf_hashes)
+
+    # Halve level by level down to the root
+    levels = [nodes]
+    while len(nodes) > _DIGEST_SIZE:
+        nodes = b''.join(_hash_pairs(nodes))
+        levels.append(nodes)
+
+    # 2n - 1 nodes in total, packed into one immutable buffer with the root last
+    buf = memoryview(b''.join(levels))
+    tree: MerkleTree = []
+    offset = 0
+    for level in levels:
+        tree.append(buf[offset:offset + len(level)])
+        offset += len(level)
     return tree
 
-def get_merkle_root(tree: List[List[str]]) -> str:
-    """Returns the Merkle root."""
-    return tree[-1][0] if tree and tree[-1] else 'EMPTY_CONTRACT' # Check if root level is not empty
+def _hash_pairs(nodes: bytes) -> List[bytes]:
+    """Hashes an even-length level's digests pairwise into the digests of the next level."""
+    # Every pair is a fixed 64-byte message. The default hashlib.sha256 is OpenSSL-backed, and
+    # OpenSSL already runs its compression function on SHA-NI where the CPU supports it.
+    hash_new = _hash_new
+    pair_size = 2 * _DIGEST_SIZE
+    # Callers hand in full pairs only, so the loop needs no odd-node check;
+    # slicing bytes is cheaper than slicing a memoryview here
+    return [hash_new(nodes[start:start + pair_size]).digest() for start in range(0, len(nodes), pair_size)]
+
+def update_leaf(tree: MerkleTree, index: int, new_hash: bytes) -> MerkleTree:
+    """
+    Returns a copy of the tree with leaf `index` replaced by `new_hash`.
+    Only the path from that leaf to the root is rehashed, i.e. O(log n) hashes.
+    """
+    if not tree:
+        raise IndexError("Cannot update a leaf of an empty tree.")
+    if len(new_hash) != _DIGEST_SIZE:
+        raise ValueError(f"Leaf hashes must all be {_DIGEST_SIZE}-byte digests.")
+    layout = _tree_layout(len(tree[0]) // _DIGEST_SIZE)
+    if not 0 <= index < layout[0][1]:
+        raise IndexError("Leaf index out of range.")
+
+    # Copy the whole flat buffer (a single memcpy), then rewrite only the affected path in place
+    buf = memoryview(bytearray(tree[0].obj))
+    hash_new = _hash_new
+    node = new_hash
+    for offset, count in layout:
+        start = offset + index * _DIGEST_SIZE
+        buf[start:start + _DIGEST_SIZE] = node
+        if count == 1:
+            break # Just wrote the root
+        if index == count - 1 and count % 2:
+            # Keep the padding copy of an odd level's last node in sync
+            buf[start + _DIGEST_SIZE:start + 2 * _DIGEST_SIZE] = node
+        pair_start = offset + (index & ~1) * _DIGEST_SIZE
+        node = hash_new(buf[pair_start:pair_start + 2 * _DIGEST_SIZE]).digest()
+        index >>= 1 # The parent's position on the next level up
+
+    frozen = memoryview(bytes(buf)) # Trees are immutable, like the ones build_merkle_tree returns
+    return [frozen[offset:offset + count * _DIGEST_SIZE] for offset, count in layout]
+
+def _node(level: memoryview, i: int) -> bytes:
+    """Returns node i of a tree level as bytes."""
+    return level[i * _DIGEST_SIZE:(i + 1) * _DIGEST_SIZE].tobytes()
+
+def get_merkle_root(tree: MerkleTree) -> str:
+    """Returns the Merkle root as a hex string."""
+    return tree[-1].hex() if tree and tree[-1] else 'EMPTY_CONTRACT' # Check if root level is not empty
 
 def compare_merkle_roots(root1: str, root2: str) -> bool:
     """Compares two Merkle roots for equality."""
     return root1 == root2
 
+def contract_fingerprint(leaf_hashes: List[bytes]) -> Tuple[int, int]:
+    """
+    Cheap summary of a contract's leaves: (clause count, XOR of all leaf digests).
+    Different fingerprints mean different leaf lists. That says nothing definite about
+    the roots: odd levels are padded by duplication, so [a, b, c] and [a, b, c, c] have
+    different fingerprints but the same root.
+    """
+    return len(leaf_hashes), functools.reduce(xor, (int.from_bytes(h, 'big') for h in leaf_hashes), 0)
+
+def compare_contracts(hashes_v1: List[bytes], hashes_v2: List[bytes]) -> bool:
+    """
+    Compares two contracts' leaf lists, skipping tree construction entirely when their
+    fingerprints already show they differ, and comparing Merkle roots otherwise.
+    This is stricter than comparing roots: it reports "different" for leaf lists whose
+    roots collide through odd-level padding, e.g. [a, b, c] and [a, b, c, c].
+    """
+    if contract_fingerprint(hashes_v1) != contract_fingerprint(hashes_v2):
+        return False
+    root_v1 = get_merkle_root(build_merkle_tree(hashes_v1))
+    root_v2 = get_merkle_root(build_merkle_tree(hashes_v2))
+    return compare_merkle_roots(root_v1, root_v2)
+
 def compare_and_print_clause_hashes(hashes_v1, hashes_v2, clauses_v1, clauses_v2):
     """
     Compares individual clause hashes and prints differecnes in content.
@@ -46,15 +251,19 @@ def compare_and_print_clause_hashes(hashes_v1, hashes_v2, clauses_v1, clauses_v2
     min_len = min(len(hashes_v1), len(hashes_v2))
     max_len = max(len(hashes_v1), len(hashes_v2))
 
-    for i in range(min_len):
-        h1 = hashes_v1[i]
-        h2 = hashes_v2[i]
-        if h1 == h2:
-            print(f"Clause {i+1}: ✅ Match")
-        else:
-            print(f"Clause {i+1}: ❌ Difference")
-            print(f"   🔹 V1: {clauses_v1[i]}")
-            print(f"   🔹 V2: {clauses_v2[i]}")
+    # Compare all shared positions in C (map/compress), then only visit the differing ones.
+    # Interned digests that match are the same object, so == returns on the identity check
+    # without reading the bytes; plain == (not `is`) keeps hashes from other sources correct.
+    diff_idx = list(compress(range(min_len), map(ne, hashes_v1, hashes_v2)))
+    summary = f"✅ {min_len - len(diff_idx)} matching, ❌ {len(diff_idx)} different"
+    if diff_idx:
+        summary += f" (clauses {', '.join(str(i + 1) for i in diff_idx)})"
+    print(summary)
+
+    for i in diff_idx:
+        print(f"Clause {i+1}: ❌ Difference")
+        print(f"   🔹 V1: {clauses_v1[i]}")
+        print(f"   🔹 V2: {clauses_v2[i]}")
 
     # Report clauses only present in the longer version
     if max_len > min_len:
@@ -71,11 +280,29 @@ def compare_and_print_clause_hashes(hashes_v1, hashes_v2, clauses_v1, clauses_v2
                  print(f"      Clause {i+1}: {clauses_v2[i]}")
 
 
-# A Merkle proof is a list of (hash, side) tuples
-# side is 'left' or 'right' indicating the position of the sibling
-MerkleProof = List[Tuple[str, Literal['left', 'right']]]
+# A Merkle proof is a list of (hash, is_left) tuples
+# hash is the raw sibling digest and is_left is True when the sibling sits on the left
+MerkleProof = List[Tuple[bytes, bool]]
+
+# Display name of a proof step's side, indexed by its is_left flag
+_SIDE_NAMES = ('right', 'left')
 
-def get_merkle_proof(tree: List[List[str]], target_hash: str) -> MerkleProof:
+def format_proof(proof: MerkleProof) -> List[Tuple[str, str]]:
+    """Returns the proof as (hex hash, 'left'|'right') pairs for display."""
+    return [(sibling_hash.hex(), _SIDE_NAMES[is_left]) for sibling_hash, is_left in proof]
+
+# Per-tree proof state, built lazily on the first proof: the leaf hash -> leaf position map
+# and the proofs generated so far. Keyed by the read-only leaf level itself (not the root,
+# which different trees can share; the leaves determine every other level). Each entry pins
+# its tree's buffer, so this bound, like the tree cache's, is what caps the memory held.
+@functools.lru_cache(maxsize=256)
+def _proof_state(leaves: memoryview) -> Tuple[Dict[bytes, int], Dict[bytes, MerkleProof]]:
+    """Returns (leaf position map, proof memo) for a leaf level; duplicate leaves map to their first position."""
+    count = len(leaves) // _DIGEST_SIZE
+    # Later keys win, so walk backwards to keep the first occurrence
+    return {_node(leaves, i): i for i in range(count - 1, -1, -1)}, {}
+
+def get_merkle_proof(tree: MerkleTree, target_hash: bytes) -> MerkleProof:
     """
     Generates a Merkle proof for a specific leaf hash.
     Proof consists of sibling hashes and their side relative to the target path.
@@ -83,67 +310,84 @@ def get_merkle_proof(tree: List[List[str]], target_hash: str) -> MerkleProof:
     if not tree or not tree[0]: # Ensure tree and leaf level are not empty
         return []
 
+    target_hash = bytes(target_hash)
+    index, proofs = _proof_state(tree[0])
+    cached = proofs.get(target_hash)
+    if cached is not None:
+        return list(cached)
+
+    i = index.get(target_hash)
+    if i is None:
+        # The target is not a leaf of this tree. For a POC, we can return an empty proof.
+        # Not memoized, so the memo only ever holds one proof per leaf.
+        return []
+
     proof_revised: MerkleProof = []
-    current_hash_up = target_hash
-
-    for level_index in range(len(tree) - 1): # Iterate up to the level before the root
-        level = tree[level_index]
-        found_in_level = False
-        for i in range(0, len(level), 2):
-            left_node = level[i]
-            # Handle odd number of nodes by duplicating the last one, matching build_merkle_tree
-            right_node = level[i + 1] if i + 1 < len(level) else level[i]
-
-            if current_hash_up == left_node:
-                # Target is the left node, sibling is the right
-                # Append the sibling hash and its side ('right')
-                proof_revised.append((right_node, 'right'))
-                # Compute the parent hash for the next iteration (left + right)
-                current_hash_up = hash_data(left_node + right_node)
-                found_in_level = True
-                break # Move to the next level up
-            elif current_hash_up == right_node:
-                 # Target is the right node, sibling is the left
-                 # Append the sibling hash and its side ('left')
-                 proof_revised.append((left_node, 'left'))
-                 # Compute the parent hash for the next iteration (still left + right order as per build)
-                 current_hash_up = hash_data(left_node + right_node)
-                 found_in_level = True
-                 break # Move to the next level up
-
-        if not found_in_level:
-            # This means the current_hash_up was not found in the expected level.
-            # This could indicate an invalid target_hash or a broken tree structure.
-            # For a POC, we can return an empty proof.
-            return []
-
-    # After the loop, current_hash_up should be the root.
-    # The verification function will compare this computed root with the expected root.
-    return proof_revised
-
-
-def verify_merkle_proof(proof: MerkleProof, target_hash: str, merkle_root: str) -> bool:
+    for level in tree[:-1]: # Iterate up to the level before the root
+        sibling = i ^ 1
+        # Handle odd number of nodes by duplicating the last one, matching build_merkle_tree
+        sibling_hash = _node(level, sibling if sibling * _DIGEST_SIZE < len(level) else i)
+        # An odd position is a right node, so its sibling sits on the left
+        proof_revised.append((sibling_hash, bool(i & 1)))
+        i >>= 1 # The parent's position on the next level up
+
+    # The path now ends at the root.
+    # The verification function will compare the recomputed root with the expected root.
+    proofs[target_hash] = proof_revised
+    return list(proof_revised)
+
+
+def verify_merkle_proof(proof: MerkleProof, target_hash: bytes, merkle_root: str) -> bool:
     """
-    Verifies a Merkle proof against the expected root.
+    Verifies a Merkle proof against the expected (hex) root.
     Uses the side information in the proof to correctly order hashes.
+    Results are memoized, so re-verifying the same proof costs a cache lookup.
     """
+    # Normalize to hashable steps first, so list-shaped steps (e.g. a JSON-decoded proof)
+    # and bytearray digests keep working behind the cache
+    steps = tuple((bytes(sibling_hash), bool(is_left)) for sibling_hash, is_left in proof)
+    return _verify_cached(bytes(target_hash), merkle_root, steps)
+
+@functools.lru_cache(maxsize=16384)
+def _verify_cached(target_hash: bytes, merkle_root: str, proof: Tuple[Tuple[bytes, bool], ...]) -> bool:
+    """Verifies a proof given as a tuple of steps. Proofs are deterministic, so caching is sound."""
+    hash_new = _hash_new
     computed_hash = target_hash
-    for sibling_hash, side in proof:
-        if side == 'left':
-            # Sibling is on the left, current_hash is on the right.
-            # Concatenate sibling + current_hash
-            computed_hash = hash_data(sibling_hash + computed_hash)
-        elif side == 'right':
-            # Sibling is on the right, current_hash is on the left.
-            # Concatenate current_hash + sibling
-            computed_hash = hash_data(computed_hash + sibling_hash)
-        else:
-            # Should not happen with Literal type hint, but good practice
-            print(f"Error: Invalid side '{side}' in proof step.") # Added error print for debugging
-            return False # Invalid side information
+    for sibling_hash, is_left in proof:
+        # Concatenate in tree order: sibling + current when the sibling is on the left,
+        # current + sibling otherwise
+        pair = sibling_hash + computed_hash if is_left else computed_hash + sibling_hash
+        computed_hash = hash_new(pair).digest()
 
     # After processing all proof steps, computed_hash should be the root
-    return computed_hash == merkle_root
+    return computed_hash.hex() == merkle_root
+
+def verify_merkle_proofs(proofs: List[MerkleProof], target_hashes: List[bytes], merkle_root: str) -> bool:
+    """
+    Verifies many proofs against the same expected (hex) root.
+    Returns True only if every proof verifies its target hash.
+    """
+    if len(proofs) != len(target_hashes):
+        raise ValueError("Each proof needs exactly one target hash.")
+
+    # Decode the root once for the whole batch instead of hex-encoding every computed root.
+    # Like verify_merkle_proof, only the exact lowercase hex from get_merkle_root matches:
+    # fromhex also accepts uppercase and spaces, so require the round trip to be exact.
+    try:
+        root = bytes.fromhex(merkle_root)
+    except ValueError:
+        root = None # e.g. 'EMPTY_CONTRACT', which no proof can reach
+    if root is not None and root.hex() != merkle_root:
+        root = None
+
+    hash_new = _hash_new
+    for proof, computed_hash in zip(proofs, target_hashes):
+        for sibling_hash, is_left in proof:
+            pair = sibling_hash + computed_hash if is_left else computed_hash + sibling_hash
+            computed_hash = hash_new(pair).digest()
+        if computed_hash != root:
+            return False # Stop at the first proof that fails
+    return True
 
 def log_verification(root1: str, root2: str):
     """Logs contract verification results."""
@@ -157,8 +401,9 @@ def log_verification(root1: str, root2: str):
 
 def extract_clauses(text: str) -> List[str]:
     """Extracts clauses while preserving spaces and formatting."""
-    # Split by newline and filter out lines that are empty *after* stripping whitespace
-    return [line for line in text.strip().split("\n") if line.strip()]
+    # Split by newline and drop lines that are empty *after* stripping whitespace;
+    # filter() with str.strip keeps the per-line test in C
+    return list(filter(str.strip, text.strip().split("\n")))
 
 
 # --- Example: Contract Analysis ---
@@ -196,10 +441,10 @@ clauses_v4 = extract_clauses(contract_v4_different_clause_count)
 
 
 # Hash each clause
-hashes_v1 = [hash_data(clause) for clause in clauses_v1]
-hashes_v2 = [hash_data(clause) for clause in clauses_v2]
-hashes_v3 = [hash_data(clause) for clause in clauses_v3]
-hashes_v4 = [hash_data(clause) for clause in clauses_v4]
+hashes_v1 = hash_clauses(clauses_v1)
+hashes_v2 = hash_clauses(clauses_v2)
+hashes_v3 = hash_clauses(clauses_v3)
+hashes_v4 = hash_clauses(clauses_v4)
 
 # Build Merkle trees
 tree_v1 = build_merkle_tree(hashes_v1)
@@ -221,20 +466,25 @@ print(f"V2 Root: {root_v2}")
 print(f"V3 Root: {root_v3}")
 print(f"V4 Root: {root_v4}")
 
-print("\nV1 vs V2:", "Identical" if compare_merkle_roots(root_v1, root_v2) else "Different")
+# Compare each pair of roots once and reuse the result
+same_v1_v2 = compare_merkle_roots(root_v1, root_v2)
+same_v1_v3 = compare_merkle_roots(root_v1, root_v3)
+same_v1_v4 = compare_merkle_roots(root_v1, root_v4)
+
+print("\nV1 vs V2:", "Identical" if same_v1_v2 else "Different")
 # Only print clause differences if roots differ AND the lists are non-empty for comparison
-if not compare_merkle_roots(root_v1, root_v2) and clauses_v1 and clauses_v2:
+if not same_v1_v2 and clauses_v1 and clauses_v2:
     compare_and_print_clause_hashes(hashes_v1, hashes_v2, clauses_v1, clauses_v2)
 elif not clauses_v1 or not clauses_v2:
      print("Cannot perform clause-level comparison due to empty clause lists.")
 
 
-print("\nV1 vs V3:", "Identical" if compare_merkle_roots(root_v1, root_v3) else "Different")
+print("\nV1 vs V3:", "Identical" if same_v1_v3 else "Different")
 # No need for clause comparison if identical
 
-print("\nV1 vs V4:", "Identical" if compare_merkle_roots(root_v1, root_v4) else "Different")
+print("\nV1 vs V4:", "Identical" if same_v1_v4 else "Different")
 # Only print clause differences if roots differ AND the lists are non-empty for comparison
-if not compare_merkle_roots(root_v1, root_v4) and clauses_v1 and clauses_v4:
+if not same_v1_v4 and clauses_v1 and clauses_v4:
      compare_and_print_clause_hashes(hashes_v1, hashes_v4, clauses_v1, clauses_v4)
 elif not clauses_v1 or not clauses_v4:
      print("Cannot perform clause-level comparison due to empty clause lists.")
@@ -250,7 +500,7 @@ if len(hashes_v1) > clause_index_to_prove:
 
     print(f"\nGenerating proof for: '{clause_content_v1}' (Clause {clause_index_to_prove + 1}) in V1")
     proof_v1 = get_merkle_proof(tree_v1, target_hash_v1)
-    print("Proof:", proof_v1)
+    print("Proof:", format_proof(proof_v1))
 
     is_verified_v1 = verify_merkle_proof(proof_v1, target_hash_v1, root_v1)
     print(f"Verification against V1 Root ({root_v1[:10]}...): {'✅ PASSED' if is_verified_v1 else '❌ FAILED'}")
@@ -271,7 +521,7 @@ if len(hashes_v2) > clause_index_to_prove:
 
     print(f"\nGenerating proof for: '{clause_content_v2}' (Clause {clause_index_to_prove + 1}) in V2")
     proof_v2 = get_merkle_proof(tree_v2, target_hash_v2)
-    print("Proof:", proof_v2)
+    print("Proof:", format_proof(proof_v2))
 
     is_verified_v2 = verify_merkle_proof(proof_v2, target_hash_v2, root_v2)
     print(f"Verification against V2 Root ({root_v2[:10]}...): {'✅ PASSED' if is_verified_v2 else '❌ FAILED'}")